@@ -2,6 +2,7 @@ import httpx
 import logging
 from sqlalchemy.orm import Session
 from models import BusinessResult
+from events import publish_changes
 from typing import Optional
 from datetime import datetime, timedelta
 
@@ -53,6 +54,7 @@ async def fetch_and_save_business_data(db: Session, keyword: str):
         business_url = f"https://data.ct.gov/resource/n7gp-d28j.json?$where=(lower(replace(replace(replace(replace(replace(name, ' ', ''), '%26', ''), '-', ''), '.', ''), ',', '')) like '%25{cleaned_keyword}%25'  AND date_registration >= '{date_n_days_ago(7)}')&$order=name asc"
         
         businesses = []
+        changed_ids = []
 
         async with httpx.AsyncClient(timeout=30.0) as client:
             logger.info(f"Fetching businesses for keyword: {keyword}")
@@ -77,6 +79,7 @@ async def fetch_and_save_business_data(db: Session, keyword: str):
                     if keyword not in existing.keyword.split(', '):
                         existing.keyword = existing.keyword + ', ' + keyword
                         db.commit()
+                        changed_ids.append(business_id)
                     continue
 
                 business_alei = business.get('accountnumber')
@@ -123,8 +126,10 @@ async def fetch_and_save_business_data(db: Session, keyword: str):
                     last_report_filed=None)
 
                 db.add(business_result)
+                changed_ids.append(business_id)
 
             db.commit()
+            publish_changes(keyword, changed_ids)
             logger.info(
                 f"Successfully saved business data for keyword: {keyword}")
 
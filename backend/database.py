@@ -1,6 +1,6 @@
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
-from models import Base
+from models import Base, BusinessResult
 import os
 
 DATABASE_URL = "sqlite:///./bizscope.db"
@@ -14,6 +14,9 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 def init_db():
     Base.metadata.create_all(bind=engine)
+    # create_all skips existing tables, so add indexes introduced after first run
+    for index in BusinessResult.__table__.indexes:
+        index.create(bind=engine, checkfirst=True)
 
 def get_db():
     db = SessionLocal()
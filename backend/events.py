@@ -0,0 +1,78 @@
+import asyncio
+import copy
+import json
+import logging
+from typing import AsyncIterator, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# Max events buffered per subscriber before it is considered too slow
+SUBSCRIBER_QUEUE_SIZE = 256
+
+# Queued to a subscriber to end its stream
+_CLOSED = object()
+
+
+class EventBroker:
+    """In-process fan-out of server-sent events to connected clients"""
+
+    def __init__(self):
+        self._subscribers: Set[asyncio.Queue] = set()
+
+    def publish(self, event: str, data: dict):
+        """Queue an event for every subscriber; never blocks the caller"""
+        message = {"event": event, "data": data}
+
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                # Drop the slow client; the browser reconnects and reloads its current page
+                logger.warning("Dropping slow event subscriber")
+                self._subscribers.discard(queue)
+
+    def close(self):
+        """End every open stream, e.g. so server shutdown does not wait on them"""
+        for queue in list(self._subscribers):
+            self._subscribers.discard(queue)
+            try:
+                queue.put_nowait(_CLOSED)
+            except asyncio.QueueFull:
+                # Not blocked on get(); the loop exits once it sees it was removed
+                pass
+
+    async def subscribe(self, keepalive: float = 15.0) -> AsyncIterator[Optional[dict]]:
+        """Yield published events, or None every `keepalive` seconds of silence"""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers.add(queue)
+        try:
+            while queue in self._subscribers:
+                try:
+                    message = await asyncio.wait_for(queue.get(), timeout=keepalive)
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+                if message is _CLOSED:
+                    return
+                yield message
+        finally:
+            self._subscribers.discard(queue)
+
+
+def format_sse(event: str, data: dict) -> str:
+    """Encode a single server-sent event frame"""
+    # No `id:` line: missed events are not replayed, clients resync on reconnect instead
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def publish_status(status: dict):
+    # Snapshot so later in-place mutations of app_status do not leak into queued events
+    broker.publish("status", copy.deepcopy(status))
+
+
+def publish_changes(keyword: str, business_ids: List[str]):
+    if business_ids:
+        broker.publish("results", {"keyword": keyword, "business_ids": business_ids})
+
+
+broker = EventBroker()
@@ -1,16 +1,18 @@
-from fastapi import FastAPI, Depends, HTTPException, BackgroundTasks, Query
+from fastapi import FastAPI, Depends, HTTPException, BackgroundTasks, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import or_, and_
 from typing import List, Optional
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 import asyncio
 
 from database import get_db, init_db
 from models import SavedKeyword, BusinessResult
 from schemas import Keyword, KeywordCreate, KeywordUpdate, BusinessResult as BusinessResultSchema, StatusResponse
 from data_fetcher import fetch_and_save_business_data
+from events import broker, format_sse, publish_status
 from scheduler import start_scheduler, stop_scheduler
 
 # Configure logging
@@ -99,6 +101,38 @@ async def delete_keyword(keyword_id: int, db: Session = Depends(get_db)):
     db.commit()
     return {"message": "Keyword deleted successfully"}
 
+def serialize_result(r: BusinessResult) -> dict:
+    """Convert an ORM row to a plain dict to avoid serialization issues"""
+    return {
+        "id": r.id,
+        "business_id": r.business_id,
+        "keyword": r.keyword,
+        "business_name": r.business_name,
+        "business_alei": r.business_alei,
+        "business_status": r.business_status,
+        "date_formed": r.date_formed,
+        "business_email": r.business_email,
+        "citizenship_formation": r.citizenship_formation,
+        "business_address": r.business_address,
+        "mailing_address": r.mailing_address,
+        "requires_annual_filing": r.requires_annual_filing,
+        "annual_report_due": r.annual_report_due,
+        "public_substatus": r.public_substatus,
+        "naics_code": r.naics_code,
+        "naics_sub_code": r.naics_sub_code,
+        "last_report_filed": r.last_report_filed,
+        "principal_name": r.principal_name,
+        "principal_business_address": r.principal_business_address,
+        "principal_title": r.principal_title,
+        "principal_residence_address": r.principal_residence_address,
+        "agent_name": r.agent_name,
+        "agent_business_address": r.agent_business_address,
+        "agent_mailing_address": r.agent_mailing_address,
+        "agent_residence_address": r.agent_residence_address,
+        "created_at": r.created_at.isoformat() if r.created_at else None,
+        "updated_at": r.updated_at.isoformat() if r.updated_at else None,
+    }
+
 # Results endpoints
 @app.get("/api/results", response_model=dict)
 async def get_results(
@@ -142,39 +176,7 @@ async def get_results(
         offset = (page - 1) * limit
         results = query.offset(offset).limit(limit).all()
         
-        # Convert ORM objects to dictionaries to avoid serialization issues
-        results_data = [
-            {
-                "id": r.id,
-                "business_id": r.business_id,
-                "keyword": r.keyword,
-                "business_name": r.business_name,
-                "business_alei": r.business_alei,
-                "business_status": r.business_status,
-                "date_formed": r.date_formed,
-                "business_email": r.business_email,
-                "citizenship_formation": r.citizenship_formation,
-                "business_address": r.business_address,
-                "mailing_address": r.mailing_address,
-                "requires_annual_filing": r.requires_annual_filing,
-                "annual_report_due": r.annual_report_due,
-                "public_substatus": r.public_substatus,
-                "naics_code": r.naics_code,
-                "naics_sub_code": r.naics_sub_code,
-                "last_report_filed": r.last_report_filed,
-                "principal_name": r.principal_name,
-                "principal_business_address": r.principal_business_address,
-                "principal_title": r.principal_title,
-                "principal_residence_address": r.principal_residence_address,
-                "agent_name": r.agent_name,
-                "agent_business_address": r.agent_business_address,
-                "agent_mailing_address": r.agent_mailing_address,
-                "agent_residence_address": r.agent_residence_address,
-                "created_at": r.created_at.isoformat() if r.created_at else None,
-                "updated_at": r.updated_at.isoformat() if r.updated_at else None,
-            }
-            for r in results
-        ]
+        results_data = [serialize_result(r) for r in results]
         
         return {
             "results": results_data,
@@ -194,6 +196,45 @@ async def get_results(
             "total_pages": 0
         }
 
+@app.get("/api/results/changes", response_model=dict)
+async def get_result_changes(
+    since: Optional[datetime] = None,
+    after_id: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=500),
+    db: Session = Depends(get_db)
+):
+    """Rows inserted or updated after the (since, after_id) cursor, oldest first"""
+    if after_id and not since:
+        raise HTTPException(status_code=400, detail="after_id requires since")
+
+    # updated_at is stored as naive UTC and SQLite drops tzinfo, so normalize offsets first
+    if since and since.tzinfo:
+        since = since.astimezone(timezone.utc).replace(tzinfo=None)
+
+    query = db.query(BusinessResult)
+    if since:
+        # Break updated_at ties on id so a page boundary never skips rows
+        query = query.filter(or_(
+            BusinessResult.updated_at > since,
+            and_(BusinessResult.updated_at == since, BusinessResult.id > after_id)
+        ))
+
+    # Fetch one extra row to know whether another page follows
+    results = query.order_by(BusinessResult.updated_at, BusinessResult.id).limit(limit + 1).all()
+    has_more = len(results) > limit
+    results = results[:limit]
+
+    if results:
+        cursor = {"since": results[-1].updated_at.isoformat(), "after_id": results[-1].id}
+    else:
+        cursor = {"since": since.isoformat() if since else None, "after_id": after_id}
+
+    return {
+        "results": [serialize_result(r) for r in results],
+        "cursor": cursor,
+        "has_more": has_more
+    }
+
 @app.get("/api/results/{result_id}", response_model=BusinessResultSchema)
 async def get_result(result_id: int, db: Session = Depends(get_db)):
     result = db.query(BusinessResult).filter(BusinessResult.id == result_id).first()
@@ -208,18 +249,22 @@ async def update_all_keywords_background(db: Session):
         keywords = db.query(SavedKeyword).all()
         app_status["progress"]["total_keywords"] = len(keywords)
         app_status["progress"]["keywords_done"] = 0
+        publish_status(app_status)
         
         for idx, keyword_obj in enumerate(keywords):
             logger.info(f"Updating keyword {idx + 1}/{len(keywords)}: {keyword_obj.keyword}")
             await fetch_and_save_business_data(db, keyword_obj.keyword)
             app_status["progress"]["keywords_done"] = idx + 1
+            publish_status(app_status)
         
         app_status["status"] = "idle"
         app_status["last_update"] = datetime.utcnow().isoformat()
+        publish_status(app_status)
         logger.info("All keywords updated successfully")
     except Exception as e:
         logger.error(f"Error updating keywords: {str(e)}")
         app_status["status"] = "idle"
+        publish_status(app_status)
         raise
 
 async def update_single_keyword_background(db: Session, keyword: str):
@@ -228,17 +273,21 @@ async def update_single_keyword_background(db: Session, keyword: str):
         app_status["status"] = "busy"
         app_status["progress"]["total_keywords"] = 1
         app_status["progress"]["keywords_done"] = 0
+        publish_status(app_status)
         
         logger.info(f"Updating keyword: {keyword}")
         await fetch_and_save_business_data(db, keyword)
         app_status["progress"]["keywords_done"] = 1
+        publish_status(app_status)
         
         app_status["status"] = "idle"
         app_status["last_update"] = datetime.utcnow().isoformat()
+        publish_status(app_status)
         logger.info(f"Keyword '{keyword}' updated successfully")
     except Exception as e:
         logger.error(f"Error updating keyword '{keyword}': {str(e)}")
         app_status["status"] = "idle"
+        publish_status(app_status)
         raise
 
 @app.post("/api/results/update")
@@ -269,6 +318,35 @@ async def update_results(
 async def get_results_status():
     return app_status
 
+@app.get("/api/events")
+async def stream_events(request: Request):
+    """Server-sent events: `status` on refresh progress, `results` with changed business_ids"""
+    async def event_stream():
+        # Send the current status up front so clients need no initial poll
+        yield format_sse("status", app_status)
+        async for message in broker.subscribe():
+            if await request.is_disconnected():
+                break
+            if message is None:
+                # Comment frame keeps proxies from closing an idle connection
+                yield ": keepalive\n\n"
+                continue
+            yield format_sse(message["event"], message["data"])
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        # no-transform stops the Next.js rewrite proxy from gzip-buffering the stream
+        headers={"Cache-Control": "no-cache, no-transform", "X-Accel-Buffering": "no"}
+    )
+
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+
+    class Server(uvicorn.Server):
+        async def shutdown(self, sockets=None):
+            # /api/events streams never finish on their own; end them so shutdown does not hang
+            broker.close()
+            await super().shutdown(sockets=sockets)
+
+    Server(uvicorn.Config(app, host="0.0.0.0", port=8000)).run()
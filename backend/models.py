@@ -41,4 +41,4 @@ class BusinessResult(Base):
     agent_mailing_address = Column(Text)
     agent_residence_address = Column(Text)
     created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
@@ -1,11 +1,11 @@
 'use client';
 
-import { useState, useEffect } from 'react';
+import { useState, useEffect, useRef } from 'react';
 import { Button } from './ui/button';
 import { Input } from './ui/input';
 import { Card } from './ui/card';
 import { RefreshCw, Download } from 'lucide-react';
-import { resultsApi, statusApi } from '@/lib/api';
+import { resultsApi, statusApi, eventsApi } from '@/lib/api';
 import { useStore } from '@/lib/store';
 import BusinessModal from './BusinessModal';
 import type { BusinessResult } from '@/lib/store';
@@ -34,8 +34,12 @@ export default function ResultsTable() {
   useEffect(() => {
     loadResults();
     loadStatus();
-    const interval = setInterval(loadStatus, 3000);
-    return () => clearInterval(interval);
+    // Status and newly ingested rows are pushed by the backend instead of polled
+    return eventsApi.subscribe({
+      onStatus: setStatus,
+      onResults: () => loadResultsRef.current(),
+      onReconnect: () => loadResultsRef.current(),
+    });
   }, []);
 
   useEffect(() => {
@@ -61,6 +65,10 @@ export default function ResultsTable() {
     }
   };
 
+  // Keeps the event handler on the current page and filters rather than those at mount
+  const loadResultsRef = useRef(loadResults);
+  loadResultsRef.current = loadResults;
+
   const loadStatus = async () => {
     try {
       const data = await statusApi.get();
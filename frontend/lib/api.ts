@@ -1,5 +1,5 @@
 import axios from 'axios';
-import type { Keyword, BusinessResult, StatusResponse } from './store';
+import type { Keyword, BusinessResult, StatusResponse, ResultsChangedEvent } from './store';
 
 // Use empty string for browser (will use current origin), localhost for SSR
 const API_BASE_URL = typeof window !== 'undefined' ? '' : 'http://localhost:8000';
@@ -64,3 +64,48 @@ export const statusApi = {
     return response.data;
   },
 };
+
+// Delay before reopening a stream the browser gave up on (e.g. backend down behind the proxy)
+const EVENTS_RETRY_MS = 3000;
+
+export const eventsApi = {
+  // Server-sent events replace polling /api/status; returns an unsubscribe function.
+  // Events sent while disconnected are not replayed, so onReconnect should resync.
+  subscribe: (handlers: {
+    onStatus?: (status: StatusResponse) => void;
+    onResults?: (event: ResultsChangedEvent) => void;
+    onReconnect?: () => void;
+  }): (() => void) => {
+    let source: EventSource;
+    let retryTimer: ReturnType<typeof setTimeout> | undefined;
+    let connected = false;
+
+    const connect = () => {
+      source = new EventSource(`${API_BASE_URL}/api/events`);
+      source.addEventListener('open', () => {
+        if (connected) handlers.onReconnect?.();
+        connected = true;
+      });
+      source.addEventListener('error', () => {
+        // The browser retries dropped streams itself but stops for good on an HTTP error
+        if (source.readyState === EventSource.CLOSED) {
+          retryTimer = setTimeout(connect, EVENTS_RETRY_MS);
+        }
+      });
+      if (handlers.onStatus) {
+        const onStatus = handlers.onStatus;
+        source.addEventListener('status', (e) => onStatus(JSON.parse((e as MessageEvent).data)));
+      }
+      if (handlers.onResults) {
+        const onResults = handlers.onResults;
+        source.addEventListener('results', (e) => onResults(JSON.parse((e as MessageEvent).data)));
+      }
+    };
+
+    connect();
+    return () => {
+      clearTimeout(retryTimer);
+      source.close();
+    };
+  },
+};
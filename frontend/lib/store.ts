@@ -46,6 +46,11 @@ export interface StatusResponse {
   } | null;
 }
 
+export interface ResultsChangedEvent {
+  keyword: string;
+  business_ids: string[];
+}
+
 interface StoreState {
   theme: 'light' | 'dark';
   keywords: Keyword[];